@@ -1,6 +1,8 @@
 """AI module initialization."""
 
 from .gemini_client import GeminiClient
+from .llm_router import LLMRouter, StubChatModel
+from .question_batcher import QuestionBatcher
 from .question_generator import QuestionGenerator
 
-__all__ = ["GeminiClient", "QuestionGenerator"]
+__all__ = ["GeminiClient", "LLMRouter", "StubChatModel", "QuestionBatcher", "QuestionGenerator"]
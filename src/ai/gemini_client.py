@@ -9,36 +9,48 @@ from typing import Optional, List, Dict, Any
 import json
 import time
 
+from .llm_router import LLMRouter
 from ..utils.config import Config
 from ..utils.helpers import clean_json_response, validate_question_structure
 
 class GeminiClient:
     """Client for interacting with Gemini AI via LangChain."""
     
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, router: Optional[LLMRouter] = None):
         self.config = config
         self.llm: Optional[ChatGoogleGenerativeAI] = None
-        self.is_enabled = False
+        self.router = router or LLMRouter(
+            ewma_alpha=config.router_ewma_alpha,
+            failure_threshold=config.router_failure_threshold,
+            cooldown_seconds=config.router_cooldown_seconds,
+        )
         
         self._initialize_client()
     
     def _initialize_client(self):
-        """Initialize the Gemini client if API key is available."""
+        """Initialize the Gemini backends if API key is available."""
         if self.config.has_valid_api_key:
-            try:
-                self.llm = ChatGoogleGenerativeAI(**self.config.get_gemini_config())
-                self.is_enabled = True
+            for model, tier in self.config.gemini_router_models.items():
+                try:
+                    llm = ChatGoogleGenerativeAI(**self.config.get_gemini_config(model))
+                    self.router.add_backend(model, llm, tier)
+                    if self.llm is None:
+                        self.llm = llm
+                except Exception as e:
+                    print(f"⚠️ Failed to initialize Gemini model {model}: {e}")
+            if self.llm is not None:
                 print("✅ Gemini AI enabled via LangChain (optimized for speed)")
-            except Exception as e:
-                print(f"⚠️ Failed to initialize Gemini client: {e}")
-                self.is_enabled = False
         else:
             print("⚠️ No valid Gemini API key found (set GEMINI_API_KEY for AI-powered questions)")
-            self.is_enabled = False
     
-    def generate_questions(self, user_goal: str) -> List[Dict[str, Any]]:
-        """Generate questions using Gemini AI."""
-        if not self.is_enabled or not self.llm:
+    @property
+    def is_enabled(self) -> bool:
+        """Check if any backend (Gemini or otherwise, e.g. the local stub) is available."""
+        return self.router.has_backends
+    
+    def generate_questions(self, user_goal: str, tier: str = "fast") -> List[Dict[str, Any]]:
+        """Generate questions using the fastest healthy backend for the tier."""
+        if not self.is_enabled:
             raise RuntimeError("Gemini client is not properly initialized")
         
         # Create optimized messages for question generation
@@ -49,21 +61,12 @@ class GeminiClient:
         start_time = time.time()
         
         try:
-            # Invoke the model
+            # Invoke the model through the router (invalid output counts as a backend failure)
             messages = [system_message, human_message]
-            response = self.llm.invoke(messages)
+            questions = self.router.invoke(messages, tier=tier, validator=self._parse_questions)
             
             elapsed_time = time.time() - start_time
             
-            # Process response
-            response_text = response.content.strip()
-            json_text = clean_json_response(response_text)
-            questions = json.loads(json_text)
-            
-            # Validate structure
-            if not validate_question_structure(questions):
-                raise ValueError("Generated questions don't match required structure")
-            
             print(f"✅ Generated {len(questions)} AI-powered questions ({elapsed_time:.2f}s)!")
             return questions
             
@@ -72,6 +75,62 @@ class GeminiClient:
             print(f"⚠️ AI generation failed after {elapsed_time:.2f}s: {str(e)[:50]}...")
             raise e
     
+    def generate_questions_batch(self, user_goals: List[str],
+                                 tier: str = "fast") -> List[Optional[List[Dict[str, Any]]]]:
+        """Generate questions for several goals in one request.
+        
+        Returns one entry per goal, in order; entries that fail validation are None.
+        """
+        if not self.is_enabled:
+            raise RuntimeError("Gemini client is not properly initialized")
+        
+        goal_lines = "\n".join(f"{i + 1}. {goal}" for i, goal in enumerate(user_goals))
+        system_message = SystemMessage(content=self._get_batch_system_prompt())
+        human_message = HumanMessage(content=f"User goals:\n{goal_lines}")
+        
+        start_time = time.time()
+        
+        try:
+            # Each goal needs its own share of output tokens
+            batches = self.router.invoke(
+                [system_message, human_message], tier=tier, validator=self._parse_batch,
+                generation_config={"max_output_tokens": self.config.gemini_max_tokens * len(user_goals)},
+            )
+            elapsed_time = time.time() - start_time
+        except Exception as e:
+            elapsed_time = time.time() - start_time
+            print(f"⚠️ Batched AI generation failed after {elapsed_time:.2f}s: {str(e)[:50]}...")
+            raise e
+        
+        # Demultiplex: validate each goal's questions independently
+        results: List[Optional[List[Dict[str, Any]]]] = []
+        for i in range(len(user_goals)):
+            questions = batches[i] if i < len(batches) else None
+            results.append(questions if validate_question_structure(questions) else None)
+        
+        valid_count = sum(1 for questions in results if questions is not None)
+        print(f"✅ Generated questions for {valid_count}/{len(user_goals)} goals in one request ({elapsed_time:.2f}s)!")
+        return results
+    
+    def _parse_questions(self, response: Any) -> List[Dict[str, Any]]:
+        """Parse and validate a question-generation response, raising if it is unusable."""
+        questions = json.loads(clean_json_response(response.content.strip()))
+        if not validate_question_structure(questions):
+            raise ValueError("Generated questions don't match required structure")
+        return questions
+    
+    def _parse_batch(self, response: Any) -> List[Any]:
+        """Parse a batched response into its outer JSON array, raising if it is unusable."""
+        batches = json.loads(clean_json_response(response.content.strip()))
+        if not isinstance(batches, list):
+            raise ValueError("Batched response is not a JSON array")
+        return batches
+    
+    def _get_profile_id_requirement(self) -> str:
+        """Get the prompt requirement that pins ids for remembered profile questions."""
+        topics = ", ".join(f'"{q_id}" for {topic}' for q_id, topic in self.config.profile_question_ids.items())
+        return f"- If you ask about these topics, use exactly these ids: {topics}"
+    
     def _get_system_prompt(self) -> str:
         """Get the optimized system prompt for question generation."""
         return """You are an expert stock analyst. Generate 3-4 essential questions for stock research based on the user's goal. 
@@ -88,4 +147,24 @@ Requirements:
 - Questions must be specific to the goal
 - Use natural, conversational language
 - Cover key aspects: market, preferences, criteria, timeline
-- Keep questions concise for fast responses"""
+- Keep questions concise for fast responses
+""" + self._get_profile_id_requirement()
+    
+    def _get_batch_system_prompt(self) -> str:
+        """Get the system prompt for generating questions for several goals at once."""
+        return """You are an expert stock analyst. For EACH numbered user goal, generate 3-4 essential questions for stock research.
+
+IMPORTANT: Respond ONLY with a valid JSON array containing one inner array per goal, in the same order as the goals. No explanations, no markdown, no extra text.
+
+Format:
+[
+  [{"id": "short_id", "question": "clear question?", "purpose": "brief purpose"}],
+  [{"id": "market", "question": "Which markets interest you?", "purpose": "scope"}]
+]
+
+Requirements:
+- Questions must be specific to each goal
+- Use natural, conversational language
+- Cover key aspects: market, preferences, criteria, timeline
+- Keep questions concise for fast responses
+""" + self._get_profile_id_requirement()
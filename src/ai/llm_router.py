@@ -0,0 +1,164 @@
+"""
+LLM router that spreads calls across several chat model backends.
+Tracks latency and error rate per backend and routes each call to the
+fastest healthy backend that meets the requested quality tier.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+import threading
+import time
+
+# Quality tiers, ordered from cheapest/fastest to most capable
+QUALITY_TIERS = {"fast": 0, "standard": 1, "premium": 2}
+
+
+class StubChatModel:
+    """Local deterministic chat model used for offline runs."""
+
+    def __init__(self, responder: Callable[[List[Any]], str]):
+        self.responder = responder
+
+    def invoke(self, messages: List[Any], **kwargs) -> "StubResponse":
+        """Return the responder output wrapped like a LangChain message."""
+        return StubResponse(self.responder(messages))
+
+
+@dataclass
+class StubResponse:
+    """Minimal stand-in for a LangChain AIMessage."""
+    content: str
+
+
+@dataclass
+class LLMBackend:
+    """A single chat model registered with the router, plus its health stats."""
+    name: str
+    llm: Any
+    tier: str = "fast"
+    latency_ewma: Optional[float] = None
+    error_rate: float = 0.0
+    consecutive_failures: int = 0
+    open_until: float = 0.0
+    calls: int = field(default=0, repr=False)
+
+    @property
+    def tier_rank(self) -> int:
+        return QUALITY_TIERS[self.tier]
+
+
+class LLMRouter:
+    """Route chat model calls to the fastest healthy backend for a tier."""
+
+    def __init__(self, ewma_alpha: float = 0.3, failure_threshold: int = 3,
+                 cooldown_seconds: float = 30.0):
+        self.ewma_alpha = ewma_alpha
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.backends: List[LLMBackend] = []
+        self._lock = threading.Lock()
+
+    def add_backend(self, name: str, llm: Any, tier: str = "fast") -> LLMBackend:
+        """Register a chat model (anything exposing ``invoke(messages)``)."""
+        if tier not in QUALITY_TIERS:
+            raise ValueError(f"Unknown quality tier: {tier}")
+        backend = LLMBackend(name=name, llm=llm, tier=tier)
+        with self._lock:
+            self.backends.append(backend)
+        return backend
+
+    @property
+    def has_backends(self) -> bool:
+        """Check if at least one backend is registered."""
+        return len(self.backends) > 0
+
+    def invoke(self, messages: List[Any], tier: str = "fast",
+               validator: Optional[Callable[[Any], Any]] = None, **kwargs) -> Any:
+        """Invoke the best available backend, failing over on errors.
+
+        ``validator`` is called with each response and should raise if the
+        response is unusable, so bad output counts against the backend; when
+        given, its result is returned instead of the raw response.
+        Extra keyword arguments are passed to the backend's ``invoke``.
+        """
+        if tier not in QUALITY_TIERS:
+            raise ValueError(f"Unknown quality tier: {tier}")
+
+        candidates = self._rank_backends(tier)
+        if not candidates:
+            raise RuntimeError(f"No healthy LLM backend available for tier '{tier}'")
+
+        last_error: Optional[Exception] = None
+        for backend in candidates:
+            start_time = time.time()
+            try:
+                response = backend.llm.invoke(messages, **kwargs)
+                result = validator(response) if validator is not None else response
+            except Exception as e:
+                self._record_failure(backend)
+                print(f"⚠️ LLM backend '{backend.name}' failed: {str(e)[:50]}...")
+                last_error = e
+                continue
+            self._record_success(backend, time.time() - start_time)
+            return result
+
+        raise last_error
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get a snapshot of per-backend health statistics."""
+        with self._lock:
+            return {
+                backend.name: {
+                    "tier": backend.tier,
+                    "latency_ewma": backend.latency_ewma,
+                    "error_rate": backend.error_rate,
+                    "calls": backend.calls,
+                    "circuit_open": backend.open_until > time.time(),
+                }
+                for backend in self.backends
+            }
+
+    def _rank_backends(self, tier: str) -> List[LLMBackend]:
+        """Order healthy backends meeting the tier by expected latency."""
+        min_rank = QUALITY_TIERS[tier]
+        now = time.time()
+        with self._lock:
+            eligible = [
+                (index, backend) for index, backend in enumerate(self.backends)
+                if backend.tier_rank >= min_rank and backend.open_until <= now
+            ]
+
+        def expected_cost(item):
+            index, backend = item
+            # Probe never-called backends once so every backend gets a latency sample;
+            # ones that have only ever failed go last
+            if backend.latency_ewma is None:
+                return (0 if backend.calls == 0 else 2, 0.0, index)
+            # Penalise flaky backends: expected latency per successful call
+            success_rate = max(1.0 - backend.error_rate, 0.05)
+            return (1, backend.latency_ewma / success_rate, index)
+
+        return [backend for _, backend in sorted(eligible, key=expected_cost)]
+
+    def _record_success(self, backend: LLMBackend, elapsed_time: float):
+        """Update latency/error averages and close the circuit."""
+        with self._lock:
+            backend.calls += 1
+            if backend.latency_ewma is None:
+                backend.latency_ewma = elapsed_time
+            else:
+                backend.latency_ewma += self.ewma_alpha * (elapsed_time - backend.latency_ewma)
+            backend.error_rate *= (1.0 - self.ewma_alpha)
+            backend.consecutive_failures = 0
+            backend.open_until = 0.0
+
+    def _record_failure(self, backend: LLMBackend):
+        """Update the error average and open the circuit on repeated failures."""
+        with self._lock:
+            backend.calls += 1
+            backend.error_rate += self.ewma_alpha * (1.0 - backend.error_rate)
+            backend.consecutive_failures += 1
+            if backend.consecutive_failures >= self.failure_threshold:
+                # Half-open after the cooldown: one more failure reopens it
+                backend.consecutive_failures = self.failure_threshold - 1
+                backend.open_until = time.time() + self.cooldown_seconds
@@ -0,0 +1,109 @@
+"""
+Micro-batching layer for question generation.
+Collects goals arriving within a short window and sends them to Gemini in a
+single request, then hands each caller back its own validated questions.
+"""
+
+from typing import Any, Dict, List, Optional
+import threading
+
+from .gemini_client import GeminiClient
+
+
+class _PendingGoal:
+    """A goal waiting for its share of a batched response."""
+
+    def __init__(self, user_goal: str):
+        self.user_goal = user_goal
+        self.done = threading.Event()
+        self.questions: Optional[List[Dict[str, Any]]] = None
+        self.error: Optional[Exception] = None
+
+
+class QuestionBatcher:
+    """Batch concurrent question-generation requests into one LLM call."""
+
+    def __init__(self, gemini_client: GeminiClient, window_seconds: float = 0.02,
+                 max_batch_size: int = 4):
+        self.gemini_client = gemini_client
+        self.window_seconds = window_seconds
+        self.max_batch_size = max_batch_size
+        self._pending: List[_PendingGoal] = []
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+
+    def generate_questions(self, user_goal: str) -> List[Dict[str, Any]]:
+        """Queue a goal and block until its questions are ready."""
+        pending = _PendingGoal(user_goal)
+        batch: Optional[List[_PendingGoal]] = None
+
+        with self._lock:
+            self._pending.append(pending)
+            if len(self._pending) >= self.max_batch_size:
+                batch = self._take_batch()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.window_seconds, self._flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+        # A full batch is sent from the caller that filled it
+        if batch:
+            self._process_batch(batch)
+
+        pending.done.wait()
+        if pending.error is not None:
+            raise pending.error
+        return pending.questions
+
+    def _take_batch(self) -> List[_PendingGoal]:
+        """Detach the pending goals (caller must hold the lock)."""
+        batch = self._pending
+        self._pending = []
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        return batch
+
+    def _flush(self):
+        """Send whatever has accumulated when the window closes."""
+        with self._lock:
+            batch = self._take_batch()
+        if batch:
+            self._process_batch(batch)
+
+    def _process_batch(self, batch: List[_PendingGoal]):
+        """Generate questions for a batch and wake every waiting caller."""
+        if len(batch) == 1:
+            pending = batch[0]
+            try:
+                pending.questions = self.gemini_client.generate_questions(pending.user_goal)
+            except Exception as e:
+                pending.error = e
+            finally:
+                pending.done.set()
+            return
+
+        try:
+            results = self.gemini_client.generate_questions_batch(
+                [pending.user_goal for pending in batch]
+            )
+        except Exception:
+            # Whole batch unusable (unparseable or transport error): retry every goal alone
+            results = [None] * len(batch)
+
+        retries = []
+        for pending, questions in zip(batch, results):
+            if questions is None:
+                retries.append(pending)
+            else:
+                pending.questions = questions
+                pending.done.set()
+
+        # Items that failed validation are retried alone
+        for pending in retries:
+            try:
+                pending.questions = self.gemini_client.generate_questions(pending.user_goal)
+            except Exception as e:
+                pending.error = e
+            finally:
+                pending.done.set()
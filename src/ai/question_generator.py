@@ -4,8 +4,11 @@ Provides a unified interface for generating questions based on user goals.
 """
 
 from typing import List, Dict, Any
+import json
 
 from .gemini_client import GeminiClient
+from .llm_router import LLMRouter, StubChatModel
+from .question_batcher import QuestionBatcher
 from ..fallback.questions import FallbackQuestionGenerator
 from ..utils.config import Config
 
@@ -14,8 +17,26 @@ class QuestionGenerator:
     
     def __init__(self, config: Config):
         self.config = config
-        self.gemini_client = GeminiClient(config)
         self.fallback_generator = FallbackQuestionGenerator()
+        self.router = LLMRouter(
+            ewma_alpha=config.router_ewma_alpha,
+            failure_threshold=config.router_failure_threshold,
+            cooldown_seconds=config.router_cooldown_seconds,
+        )
+        self.gemini_client = GeminiClient(config, self.router)
+        
+        # Deterministic offline backend that answers with fallback questions,
+        # only used when no real Gemini backend is available
+        if config.llm_stub_enabled and not self.router.has_backends:
+            self.router.add_backend("local-stub", StubChatModel(self._stub_responder), "premium")
+            print("🧪 Local deterministic LLM stub enabled")
+        self.batcher = None
+        if config.question_batching_enabled:
+            self.batcher = QuestionBatcher(
+                self.gemini_client,
+                window_seconds=config.question_batch_window_seconds,
+                max_batch_size=config.question_batch_max_size,
+            )
     
     def generate_questions(self, user_goal: str) -> List[Dict[str, Any]]:
         """Generate questions using AI if available, otherwise use fallback."""
@@ -26,6 +47,8 @@ class QuestionGenerator:
         if self.gemini_client.is_enabled:
             print("🧠 Consulting Gemini AI (via LangChain) for optimal questions...")
             try:
+                if self.batcher:
+                    return self.batcher.generate_questions(user_goal)
                 return self.gemini_client.generate_questions(user_goal)
             except Exception as e:
                 print(f"⚠️ AI generation failed, using smart fallback")
@@ -34,6 +57,16 @@ class QuestionGenerator:
             print("📋 Using smart fallback questions based on your goal...")
             return self.fallback_generator.generate_questions(user_goal)
     
+    def _stub_responder(self, messages: List[Any]) -> str:
+        """Answer a question-generation prompt with fallback questions as JSON."""
+        content = messages[-1].content
+        if content.startswith("User goals:"):
+            # Batched prompt: one numbered goal per line
+            goals = [line.split(". ", 1)[-1] for line in content.splitlines()[1:]]
+            return json.dumps([self.fallback_generator.generate_questions(goal) for goal in goals])
+        user_goal = content.replace("User goal:", "", 1).strip()
+        return json.dumps(self.fallback_generator.generate_questions(user_goal))
+    
     @property
     def is_ai_enabled(self) -> bool:
         """Check if AI question generation is available."""
@@ -3,40 +3,61 @@ Main Dynamic Stock Agent class.
 Orchestrates the conversation flow and manages the overall agent behavior.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 from .state import AgentState
 from .workflow import WorkflowBuilder
 from ..ai.question_generator import QuestionGenerator
 from ..handlers.input_handler import InputHandler
 from ..handlers.output_handler import OutputHandler
+from ..memory.profile_store import ProfileStore
+from ..replay.recorder import SessionRecorder
+from ..replay.session_log import SessionLog
 from ..utils.config import Config
+from ..utils.helpers import next_unanswered_index
 
 class DynamicStockAgent:
     """Main agent class that orchestrates the stock research conversation."""
     
-    def __init__(self):
+    def __init__(self, config: Optional[Config] = None):
         # Initialize components
-        self.config = Config()
+        self.config = config or Config()
         self.question_generator = QuestionGenerator(self.config)
         self.input_handler = InputHandler()
         self.output_handler = OutputHandler(
             self.config.app_name, 
             self.config.welcome_message
         )
+        self.profile_store: Optional[ProfileStore] = None
+        if self.config.profile_memory_enabled:
+            try:
+                self.profile_store = ProfileStore(
+                    self.config.profile_db_path,
+                    self.config.profile_max_age_days * 24 * 3600
+                )
+            except Exception as e:
+                print(f"⚠️ Profile memory unavailable: {e}")
+                self.profile_store = None
         
         # Build workflow
         workflow_builder = WorkflowBuilder(self)
         self.graph = workflow_builder.build_workflow()
         
+        # Record this session for offline replay if requested
+        if self.config.session_record_path:
+            recorder = SessionRecorder(SessionLog(self.config.session_record_path), self.config.user_id)
+            recorder.attach(self)
+        
         print("🚀 Initializing Dynamic Stock Research Agent...")
     
     def run(self) -> Optional[Dict[str, Any]]:
         """Run the dynamic stock agent."""
         initial_state = {
+            "user_id": self.config.user_id,
             "user_goal": "",
             "current_question_index": 0,
             "user_answers": {},
+            "remembered_answers": {},
             "questions_list": [],
             "questions_generated": False,
             "current_step": "",
@@ -47,6 +68,11 @@ class DynamicStockAgent:
         try:
             result = self.graph.invoke(initial_state)
             
+            # The user exited before finishing: nothing to report or hand on
+            if result.get("current_step") == "exited":
+                self.output_handler.show_goodbye()
+                return None
+            
             if result.get("all_complete"):
                 self.output_handler.show_success_message()
                 
@@ -83,19 +109,25 @@ class DynamicStockAgent:
         
         # Handle exit commands
         if self.input_handler.is_exit_command(user_goal, self.config.exit_commands):
-            return {**state, "questions_list": [], "all_complete": True}
+            return {**state, "questions_list": [], "all_complete": True, "current_step": "exited"}
         
         self.output_handler.show_thinking_message()
         
         # Generate questions
         questions = self.question_generator.generate_questions(user_goal)
         
+        # Pre-fill still-fresh answers remembered from earlier sessions
+        remembered = self._load_remembered_answers(state["user_id"], questions)
+        if remembered:
+            self.output_handler.show_remembered_answers(remembered)
+        
         return {
             **state,
             "questions_list": questions,
             "questions_generated": True,
-            "current_question_index": 0,
-            "user_answers": {},
+            "current_question_index": next_unanswered_index(questions, remembered),
+            "user_answers": dict(remembered),
+            "remembered_answers": remembered,
             "current_step": "questions_ready",
             "messages": state.get("messages", []) + [f"Generated {len(questions)} questions"]
         }
@@ -118,7 +150,7 @@ class DynamicStockAgent:
         
         # Handle exit during question answering
         if self.input_handler.is_exit_command(answer, self.config.exit_commands):
-            return {**state, "all_complete": True}
+            return {**state, "all_complete": True, "current_step": "exited"}
         
         # Update user answers
         updated_answers = state["user_answers"].copy()
@@ -127,7 +159,7 @@ class DynamicStockAgent:
         return {
             **state,
             "user_answers": updated_answers,
-            "current_question_index": current_index + 1,
+            "current_question_index": next_unanswered_index(questions, updated_answers, current_index + 1),
             "current_step": f"answered_q{current_index + 1}",
             "messages": state.get("messages", []) + [f"Q{current_index + 1}: {answer}"]
         }
@@ -140,9 +172,39 @@ class DynamicStockAgent:
             state["user_answers"]
         )
         
+        self._save_profile_answers(state)
+        
         return {
             **state,
             "all_complete": True,
             "current_step": "complete",
             "messages": state.get("messages", []) + ["Conversation completed"]
         }
+    
+    def _load_remembered_answers(self, user_id: str, questions: List[Dict[str, str]]) -> Dict[str, str]:
+        """Get fresh profile answers for the profile questions in this session."""
+        if not self.profile_store:
+            return {}
+        
+        question_ids = {q["id"] for q in questions} & set(self.config.profile_question_ids)
+        answers = self.profile_store.get_fresh_answers(user_id, question_ids)
+        
+        # Never reuse placeholders saved from non-interactive runs
+        return {
+            q_id: answer for q_id, answer in answers.items()
+            if not self.input_handler.is_default_answer(answer, q_id)
+        }
+    
+    def _save_profile_answers(self, state: AgentState):
+        """Persist profile answers the user typed this session (remembered ones keep their timestamp)."""
+        if not self.profile_store:
+            return
+        
+        remembered = state.get("remembered_answers", {})
+        new_answers = {
+            q_id: answer for q_id, answer in state["user_answers"].items()
+            if q_id in self.config.profile_question_ids and q_id not in remembered
+            and not self.input_handler.is_default_answer(answer, q_id)
+        }
+        if new_answers:
+            self.profile_store.save_answers(state["user_id"], new_answers)
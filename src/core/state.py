@@ -8,9 +8,11 @@ from typing import TypedDict, List, Dict
 class AgentState(TypedDict):
     """State definition for the dynamic stock screener agent."""
     # User input
+    user_id: str
     user_goal: str
     current_question_index: int
     user_answers: Dict[str, str]
+    remembered_answers: Dict[str, str]
     
     # AI-generated questions
     questions_list: List[Dict[str, str]]
@@ -7,6 +7,7 @@ from typing import Literal
 from langgraph.graph import StateGraph, END
 
 from .state import AgentState
+from ..utils.helpers import next_unanswered_index
 
 class WorkflowBuilder:
     """Builds the LangGraph workflow for the stock agent."""
@@ -30,7 +31,17 @@ class WorkflowBuilder:
         
         # Add edges
         workflow.add_edge("ask_goal", "generate_questions")
-        workflow.add_edge("generate_questions", "ask_question")
+        
+        # Skip straight to completion when every question is already answered
+        workflow.add_conditional_edges(
+            "generate_questions",
+            self._should_continue_questions,
+            {
+                "continue": "ask_question",
+                "complete": "complete",
+                "exit": END,
+            },
+        )
         
         # Conditional edge to continue asking questions or complete
         workflow.add_conditional_edges(
@@ -39,6 +50,7 @@ class WorkflowBuilder:
             {
                 "continue": "ask_question",
                 "complete": "complete",
+                "exit": END,
             },
         )
         
@@ -46,12 +58,21 @@ class WorkflowBuilder:
         
         return workflow.compile()
     
-    def _should_continue_questions(self, state: AgentState) -> Literal["continue", "complete"]:
-        """Decide whether to ask more questions or complete."""
-        current_index = state["current_question_index"]
-        total_questions = len(state["questions_list"])
+    def _should_continue_questions(self, state: AgentState) -> Literal["continue", "complete", "exit"]:
+        """Decide whether to ask more questions, complete, or exit."""
+        # The user asked to exit: skip the completion summary entirely
+        if state.get("current_step") == "exited":
+            return "exit"
+        
+        questions = state["questions_list"]
+        total_questions = len(questions)
+        
+        # Remembered answers count as answered, so only unanswered questions remain
+        next_index = next_unanswered_index(
+            questions, state["user_answers"], state["current_question_index"]
+        )
         
-        if current_index < total_questions:
+        if next_index < total_questions:
             return "continue"
         else:
             return "complete"
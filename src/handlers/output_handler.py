@@ -26,6 +26,12 @@ class OutputHandler:
         """Display thinking message."""
         print("\n🤔 Let me think about what information I need...")
     
+    def show_remembered_answers(self, answers: Dict[str, str]):
+        """Display answers remembered from previous sessions."""
+        print("\n🧠 Using your saved preferences from earlier sessions:")
+        for q_id, answer in answers.items():
+            print(f"   • {q_id}: {answer}")
+    
     def show_question(self, question: Dict[str, str], current_index: int, total_questions: int):
         """Display a question to the user."""
         print(f"\n📝 Question {current_index + 1} of {total_questions}")
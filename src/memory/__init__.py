@@ -0,0 +1,5 @@
+"""Memory module initialization."""
+
+from .profile_store import ProfileStore
+
+__all__ = ["ProfileStore"]
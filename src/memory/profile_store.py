@@ -0,0 +1,62 @@
+"""
+Persistent user profile store backed by SQLite.
+Remembers profile answers (market, style, ...) per user so returning users
+are not asked the same questions every session.
+"""
+
+from typing import Dict, Iterable, Optional
+import sqlite3
+import threading
+import time
+
+class ProfileStore:
+    """Stores per-user answers keyed by question id, with staleness timestamps."""
+    
+    def __init__(self, db_path: str, max_age_seconds: float):
+        self.db_path = db_path
+        self.max_age_seconds = max_age_seconds
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS profile_answers (
+                   user_id TEXT NOT NULL,
+                   question_id TEXT NOT NULL,
+                   answer TEXT NOT NULL,
+                   updated_at REAL NOT NULL,
+                   PRIMARY KEY (user_id, question_id)
+               )"""
+        )
+        self._conn.commit()
+    
+    def get_fresh_answers(self, user_id: str,
+                          question_ids: Optional[Iterable[str]] = None) -> Dict[str, str]:
+        """Get the user's answers that are not older than the staleness limit."""
+        cutoff = time.time() - self.max_age_seconds
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT question_id, answer FROM profile_answers "
+                "WHERE user_id = ? AND updated_at >= ?",
+                (user_id, cutoff),
+            ).fetchall()
+        
+        answers = dict(rows)
+        if question_ids is not None:
+            wanted = set(question_ids)
+            answers = {q_id: answer for q_id, answer in answers.items() if q_id in wanted}
+        return answers
+    
+    def save_answers(self, user_id: str, answers: Dict[str, str]):
+        """Insert or refresh the user's answers."""
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO profile_answers "
+                "(user_id, question_id, answer, updated_at) VALUES (?, ?, ?, ?)",
+                [(user_id, q_id, answer, now) for q_id, answer in answers.items()],
+            )
+            self._conn.commit()
+    
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
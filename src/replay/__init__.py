@@ -0,0 +1,7 @@
+"""Replay module initialization."""
+
+from .session_log import SessionLog, load_sessions
+from .recorder import SessionRecorder
+from .replayer import SessionReplayer, replay_sessions
+
+__all__ = ["SessionLog", "load_sessions", "SessionRecorder", "SessionReplayer", "replay_sessions"]
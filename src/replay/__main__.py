@@ -0,0 +1,22 @@
+"""
+Replay recorded sessions offline.
+Usage: python -m src.replay SESSION_LOG [--preserve-timing] [--repeat N]
+"""
+
+import argparse
+
+from .replayer import replay_sessions
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Replay recorded agent sessions offline.")
+    parser.add_argument("log_path", help="Session log written with SESSION_RECORD_PATH")
+    parser.add_argument("--preserve-timing", action="store_true",
+                        help="Wait the recorded LLM latencies and user think times")
+    parser.add_argument("--repeat", type=int, default=1, help="Replay the whole log N times")
+    args = parser.parse_args()
+    
+    replay_sessions(args.log_path, args.preserve_timing, args.repeat)
+
+if __name__ == "__main__":
+    main()
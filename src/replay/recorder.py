@@ -0,0 +1,100 @@
+"""
+Session recorder for the record/replay harness.
+Captures LLM prompts, responses and latencies plus user inputs and think times.
+"""
+
+from typing import Any, Dict, List
+import time
+import uuid
+
+from .session_log import SessionLog, message_digest
+from ..handlers.input_handler import InputHandler
+
+class SessionRecorder:
+    """Records one agent session to a session log."""
+    
+    def __init__(self, log: SessionLog, user_id: str):
+        self.log = log
+        self.session_id = uuid.uuid4().hex[:12]
+        self.record("session", user_id=user_id, started_at=time.time())
+    
+    def record(self, event_type: str, **fields):
+        """Append an event for this session."""
+        self.log.append({"session": self.session_id, "type": event_type, **fields})
+    
+    def attach(self, agent):
+        """Route the agent's LLM calls, user input and profile lookups through the recorder."""
+        gemini_client = agent.question_generator.gemini_client
+        gemini_client.router = RecordingRouter(gemini_client.router, self)
+        agent.input_handler = RecordingInputHandler(agent.input_handler, self)
+        if agent.profile_store:
+            agent.profile_store = RecordingProfileStore(agent.profile_store, self)
+
+class RecordingRouter:
+    """Wraps an LLM router and records every call made through it."""
+    
+    def __init__(self, router, recorder: SessionRecorder):
+        self.router = router
+        self.recorder = recorder
+    
+    def __getattr__(self, name):
+        return getattr(self.router, name)
+    
+    def invoke(self, messages: List[Any], tier: str = "fast", validator=None, **kwargs) -> Any:
+        """Invoke the wrapped router and record the prompt digest, outcome and latency."""
+        responses = []
+        
+        def capture(response):
+            # The last captured response is the one the router accepted
+            responses.append(response)
+            return validator(response) if validator is not None else response
+        
+        start_time = time.time()
+        try:
+            result = self.router.invoke(messages, tier=tier, validator=capture, **kwargs)
+        except Exception as e:
+            self.recorder.record("llm", digest=message_digest(messages), prompt=messages[-1].content,
+                                 error=str(e), latency=time.time() - start_time)
+            raise
+        # The digest is the replay key; the prompt (last message) is kept for inspection
+        self.recorder.record("llm", digest=message_digest(messages), prompt=messages[-1].content,
+                             response=responses[-1].content, latency=time.time() - start_time)
+        return result
+
+class RecordingInputHandler(InputHandler):
+    """Wraps an input handler and records what the user typed and how long it took."""
+    
+    def __init__(self, input_handler: InputHandler, recorder: SessionRecorder):
+        self.input_handler = input_handler
+        self.recorder = recorder
+    
+    def get_user_goal(self) -> str:
+        """Get and record the user's goal."""
+        start_time = time.time()
+        goal = self.input_handler.get_user_goal()
+        self.recorder.record("input", kind="goal", value=goal, latency=time.time() - start_time)
+        return goal
+    
+    def get_answer(self, question_text: str, question_id: str) -> str:
+        """Get and record the user's answer to a question."""
+        start_time = time.time()
+        answer = self.input_handler.get_answer(question_text, question_id)
+        self.recorder.record("input", kind="answer", question_id=question_id,
+                             value=answer, latency=time.time() - start_time)
+        return answer
+
+class RecordingProfileStore:
+    """Wraps a profile store and records the remembered answers a session started from."""
+    
+    def __init__(self, profile_store, recorder: SessionRecorder):
+        self.profile_store = profile_store
+        self.recorder = recorder
+    
+    def __getattr__(self, name):
+        return getattr(self.profile_store, name)
+    
+    def get_fresh_answers(self, user_id: str, question_ids=None) -> Dict[str, str]:
+        """Get fresh answers from the wrapped store and record them."""
+        answers = self.profile_store.get_fresh_answers(user_id, question_ids)
+        self.recorder.record("profile", answers=answers)
+        return answers
@@ -0,0 +1,120 @@
+"""
+Session replayer for the record/replay harness.
+Re-runs recorded sessions through the full workflow without Gemini or a human,
+either at maximum speed or preserving the recorded timing.
+"""
+
+from collections import defaultdict, deque
+from typing import Any, Dict, List, Optional
+import time
+
+from .session_log import load_sessions, message_digest
+from ..ai.llm_router import StubResponse
+from ..handlers.input_handler import InputHandler
+from ..memory.profile_store import ProfileStore
+from ..utils.config import Config
+
+class SessionReplayer:
+    """Replays one recorded session deterministically."""
+    
+    def __init__(self, events: List[Dict[str, Any]], preserve_timing: bool = False):
+        self.events = events
+        self.preserve_timing = preserve_timing
+    
+    def attach(self, agent):
+        """Replace the agent's LLM calls, user input and profile lookups with recorded ones."""
+        gemini_client = agent.question_generator.gemini_client
+        gemini_client.router = ReplayRouter(
+            [e for e in self.events if e["type"] == "llm"], self.preserve_timing
+        )
+        agent.input_handler = ReplayInputHandler(
+            [e for e in self.events if e["type"] == "input"], self.preserve_timing
+        )
+        
+        # Seed an in-memory store so the session skips the same questions it did originally
+        session_event = next(e for e in self.events if e["type"] == "session")
+        agent.config.user_id = session_event["user_id"]
+        agent.profile_store = None
+        profile_events = [e for e in self.events if e["type"] == "profile"]
+        if profile_events:
+            agent.profile_store = ProfileStore(":memory:", agent.config.profile_max_age_days * 24 * 3600)
+            agent.profile_store.save_answers(session_event["user_id"], profile_events[0]["answers"])
+
+class ReplayRouter:
+    """Stands in for the LLM router, answering prompts from recorded responses."""
+    
+    def __init__(self, llm_events: List[Dict[str, Any]], preserve_timing: bool = False):
+        self.preserve_timing = preserve_timing
+        self._responses = defaultdict(deque)
+        for event in llm_events:
+            self._responses[event["digest"]].append(event)
+    
+    @property
+    def has_backends(self) -> bool:
+        return True
+    
+    def invoke(self, messages: List[Any], tier: str = "fast", validator=None, **kwargs) -> Any:
+        """Return the next recorded response for this prompt."""
+        recorded = self._responses.get(message_digest(messages))
+        if not recorded:
+            raise RuntimeError("No recorded response for this prompt")
+        
+        event = recorded.popleft()
+        if self.preserve_timing:
+            time.sleep(event["latency"])
+        if "error" in event:
+            raise RuntimeError(event["error"])
+        response = StubResponse(event["response"])
+        return validator(response) if validator is not None else response
+
+class ReplayInputHandler(InputHandler):
+    """Stands in for the user, typing the recorded inputs in order."""
+    
+    def __init__(self, input_events: List[Dict[str, Any]], preserve_timing: bool = False):
+        self.preserve_timing = preserve_timing
+        self._inputs = deque(input_events)
+    
+    def get_user_goal(self) -> str:
+        """Return the recorded goal."""
+        return self._next_value()
+    
+    def get_answer(self, question_text: str, question_id: str) -> str:
+        """Return the next recorded answer."""
+        return self._next_value()
+    
+    def _next_value(self) -> str:
+        """Pop the next recorded input, waiting the recorded think time if requested."""
+        if not self._inputs:
+            # Nothing left to say: end the session like the user would
+            return "quit"
+        
+        event = self._inputs.popleft()
+        if self.preserve_timing:
+            time.sleep(event["latency"])
+        return event["value"]
+
+def replay_sessions(log_path: str, preserve_timing: bool = False,
+                    repeat: int = 1) -> List[Optional[Dict[str, Any]]]:
+    """Replay every session in a log through the full agent workflow."""
+    from ..core.agent import DynamicStockAgent
+    
+    sessions = load_sessions(log_path)
+    results = []
+    start_time = time.time()
+    
+    for _ in range(repeat):
+        for events in sessions:
+            # Offline config: no Gemini, no stub, no real profile store, no re-recording
+            config = Config()
+            config.gemini_api_key = None
+            config.llm_stub_enabled = False
+            config.profile_memory_enabled = False
+            config.session_record_path = None
+            
+            agent = DynamicStockAgent(config)
+            SessionReplayer(events, preserve_timing).attach(agent)
+            results.append(agent.run())
+    
+    elapsed_time = time.time() - start_time
+    print(f"\n⏱️ Replayed {len(results)} sessions in {elapsed_time:.2f}s")
+    return results
@@ -0,0 +1,43 @@
+"""
+Append-only session log used by the record/replay harness.
+Each line is one compact JSON event tagged with the session it belongs to.
+"""
+
+from typing import Any, Dict, List
+import hashlib
+import json
+import threading
+
+class SessionLog:
+    """Thread-safe, append-only JSON-lines event log."""
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+    
+    def append(self, event: Dict[str, Any]):
+        """Append a single event and flush it to disk."""
+        line = json.dumps(event, separators=(",", ":"), ensure_ascii=False)
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as log_file:
+                log_file.write(line + "\n")
+
+def load_sessions(path: str) -> List[List[Dict[str, Any]]]:
+    """Load a session log, grouping events by session in recording order."""
+    sessions: Dict[str, List[Dict[str, Any]]] = {}
+    with open(path, encoding="utf-8") as log_file:
+        for line in log_file:
+            line = line.strip()
+            if not line:
+                continue
+            event = json.loads(line)
+            sessions.setdefault(event["session"], []).append(event)
+    return list(sessions.values())
+
+def message_digest(messages: List[Any]) -> str:
+    """Get a short, stable digest of a prompt's messages."""
+    digest = hashlib.sha1()
+    for message in messages:
+        digest.update(type(message).__name__.encode())
+        digest.update(str(message.content).encode())
+    return digest.hexdigest()[:16]
@@ -20,6 +20,35 @@ class Config:
         self.gemini_max_tokens = 500   # Limit for faster response
         self.gemini_top_p = 0.8       # Reduce randomness for speed
         
+        # LLM Router Configuration (model name -> quality tier)
+        self.gemini_router_models = {
+            self.gemini_model: "fast",
+            "gemini-1.5-pro": "premium",
+        }
+        self.router_ewma_alpha = 0.3        # Weight of the latest latency sample
+        self.router_failure_threshold = 3   # Consecutive failures before circuit opens
+        self.router_cooldown_seconds = 30.0 # Time before a broken backend is retried
+        self.llm_stub_enabled = os.getenv("LLM_STUB_ENABLED", "").lower() in ("1", "true", "yes")
+        
+        # Question micro-batching (for batch/replay or server use)
+        self.question_batching_enabled = os.getenv("QUESTION_BATCHING_ENABLED", "").lower() in ("1", "true", "yes")
+        self.question_batch_window_seconds = 0.02  # Wait up to 20 ms for more goals
+        self.question_batch_max_size = 4           # Output tokens scale with batch size
+        
+        # Profile memory (remembers profile answers for returning users)
+        self.profile_memory_enabled = os.getenv("PROFILE_MEMORY_ENABLED", "1").lower() in ("1", "true", "yes")
+        self.profile_db_path = os.getenv("PROFILE_DB_PATH", "agent_profiles.db")
+        self.profile_max_age_days = 30  # Re-ask answers older than this
+        self.profile_question_ids = {  # Question id -> topic it must be used for
+            'market': "which markets or regions interest the user",
+            'style': "investment style and risk tolerance",
+            'timeline': "investment timeline or time horizon",
+        }
+        self.user_id = os.getenv("AGENT_USER_ID") or os.getenv("USER") or os.getenv("USERNAME") or "default"
+        
+        # Session recording for the record/replay harness (append-only JSON lines)
+        self.session_record_path = os.getenv("SESSION_RECORD_PATH")
+        
         # Application Settings
         self.app_name = "🤖 INTELLIGENT STOCK RESEARCH AGENT"
         self.welcome_message = """Hello! I'm your AI-powered stock research assistant.
@@ -35,10 +64,10 @@ intelligent questions based on what you want to accomplish."""
         return (self.gemini_api_key and 
                 self.gemini_api_key != "your_gemini_api_key_here")
     
-    def get_gemini_config(self) -> dict:
+    def get_gemini_config(self, model: str = None) -> dict:
         """Get Gemini configuration parameters."""
         return {
-            "model": self.gemini_model,
+            "model": model or self.gemini_model,
             "google_api_key": self.gemini_api_key,
             "temperature": self.gemini_temperature,
             "max_tokens": self.gemini_max_tokens,
@@ -44,11 +44,21 @@ def validate_question_structure(questions: List[Dict[str, Any]]) -> bool:
     
     required_fields = ['id', 'question', 'purpose']
     for question in questions:
+        if not isinstance(question, dict):
+            return False
         if not all(field in question for field in required_fields):
             return False
     
     return True
 
+def next_unanswered_index(questions: List[Dict[str, Any]], answers: Dict[str, str],
+                          start_index: int = 0) -> int:
+    """Get the index of the next question without an answer (len(questions) if none)."""
+    for index in range(start_index, len(questions)):
+        if questions[index]["id"] not in answers:
+            return index
+    return len(questions)
+
 def format_conversation_summary(goal: str, answers: Dict[str, str], 
                                questions: List[Dict[str, str]]) -> str:
     """Format a conversation summary for display."""